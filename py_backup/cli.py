@@ -17,6 +17,18 @@ def valid_num_incremental(value: str) -> int:
     return ivalue
 
 
+def valid_max_workers(value: str) -> int:
+    try:
+        ivalue = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"{value} is not a valid integer!") from exc
+
+    if ivalue < 1:
+        raise argparse.ArgumentTypeError("--max-workers needs to be at least 1!")
+
+    return ivalue
+
+
 def add_common_arguments(subparser: argparse.ArgumentParser):
     subparser.add_argument("source", help="Source directory")
     subparser.add_argument("destination", help="Destination directory")
@@ -43,6 +55,7 @@ def incremental(args: argparse.Namespace):
         args.dry_run,
         args.backup_dir,
         args.num_incremental,
+        args.skip_unchanged,
     )
 
 
@@ -54,6 +67,8 @@ def compare(args: argparse.Namespace):
         unilateral_compare=args.unilateral_compare,
         include_equal_entries=args.include_equals,
         excludes=excludes,
+        content_check=args.content_check,
+        max_workers=args.max_workers,
     )
 
     if args.expand_dirs:
@@ -143,6 +158,14 @@ def main():
         type=valid_num_incremental,
         help="Number of incremental backups to keep",
     )
+    incremental_parser.add_argument(
+        "--skip-unchanged",
+        action="store_true",
+        help=(
+            "Skip the sync if the source is unchanged since the last successful "
+            + "backup. Changes made directly in the destination are not detected."
+        ),
+    )
     incremental_parser.set_defaults(func=incremental)
 
     # Compare directory command. Does not do any backups!
@@ -174,6 +197,25 @@ def main():
         action="store_true",
         help=("Include equal files in the comparison result"),
     )
+    compare_parser.add_argument(
+        "-c",
+        "--content-check",
+        action="store_true",
+        help=(
+            "Compare content of equal sized files with differing modification times. "
+            + "Files with identical content are reported as equal."
+        ),
+    )
+    compare_parser.add_argument(
+        "-w",
+        "--max-workers",
+        type=valid_max_workers,
+        default=1,
+        help=(
+            "Number of threads used to compare directory pairs concurrently. "
+            + "Can speed up comparisons on network file systems. Defaults to 1."
+        ),
+    )
     compare_parser.add_argument(
         "--expand-dirs",
         action="store_true",
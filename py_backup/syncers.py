@@ -1,34 +1,190 @@
+import asyncio
+import locale
+import os
+import shutil
 import subprocess
+import tempfile
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import Callable, Iterable
+from .comparer import DirComparator, FileStatus, FileType
 from .config import RSYNC_DEFAULTS, ROBOCOPY_DEFAULTS
 from .logging_config import get_logger
 
+try:
+    # librsync is an optional dependency (pip install py_backup[librsync])
+    import librsync
+except ImportError:
+    librsync = None
+
+try:
+    # liburing is an optional dependency (pip install py_backup[liburing])
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    # Only available on unix, used to probe for copy on write support
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 logger = get_logger(__name__)
 
 
+# Linux ioctl cloning a whole file copy on write, see ioctl_ficlone(2)
+_FICLONE = 0x40049409
+_reflink_support: dict[int, bool] = {}
+
+
+def _supports_reflink(directory: Path) -> bool:
+    """
+    Used by Rsync.sync. Checks, once per file system (st_dev), if files in
+    directory can be cloned copy on write (reflinks, e.g. on Btrfs or XFS) by
+    cloning a small probe file.
+    """
+    dev = os.stat(directory).st_dev
+    if dev not in _reflink_support:
+        supported = False
+        if fcntl is not None:
+            try:
+                with tempfile.TemporaryFile(dir=directory) as probe_src:
+                    with tempfile.TemporaryFile(dir=directory) as probe_dst:
+                        probe_src.write(b"\0")
+                        probe_src.flush()
+                        fcntl.ioctl(probe_dst.fileno(), _FICLONE, probe_src.fileno())
+                supported = True
+            except OSError:
+                pass
+        _reflink_support[dev] = supported
+
+    return _reflink_support[dev]
+
+
+def _is_empty_dir(directory: Path) -> bool:
+    """Used by Rsync.sync. True if directory has no entries."""
+    with os.scandir(directory) as it:
+        return next(it, None) is None
+
+
+_sync_pool = None
+_sync_pool_lock = threading.Lock()
+
+
+def _get_sync_pool() -> ThreadPoolExecutor:
+    """
+    Used by Rsync.sync_many. Returns the thread pool shared by all sync_many
+    calls, created on first use, so repeated calls reuse its threads.
+    """
+    global _sync_pool
+    with _sync_pool_lock:
+        if _sync_pool is None:
+            _sync_pool = ThreadPoolExecutor(
+                max_workers=(os.cpu_count() or 1) * 2,
+                thread_name_prefix="py_backup_sync",
+            )
+    return _sync_pool
+
+
+@lru_cache(maxsize=None)
+def _which(cli_program: str) -> str | None:
+    """
+    Used by SyncABC.subprocess_run. Cached so repeated spawns of the same tool
+    (e.g. in Rsync.sync_many) skip the PATH lookup exec would otherwise do.
+    """
+    return shutil.which(cli_program)
+
+
+@lru_cache(maxsize=32)
+def _rsync_options(
+    options: tuple[str, ...], delete: bool, dry_run: bool, unwanted: frozenset
+) -> tuple[str, ...]:
+    """
+    Used by Rsync.get_args. Returns the filtered options part of the rsync args.
+    Cached since a syncer is usually called with the same options and flags
+    over and over (e.g. scheduled jobs or Rsync.sync_many).
+    """
+    options = list(options)
+    if delete:
+        options.append("--delete")
+    if dry_run:
+        options.append("--dry-run")
+
+    return tuple(SyncABC.filter_args(options, unwanted))
+
+
+@dataclass
+class SyncResult:
+    """
+    The outcome of one rsync call made by Rsync.sync_many.
+
+    Attributes:
+        sources (list[Path]): The source dirs synced to dst.
+        dst (Path): The destination dir.
+        process (subprocess.CompletedProcess | None): The finished process. None
+            if the call raised before completing (e.g. on timeout).
+        error (Exception | None): The error of a failed call, None on success.
+    """
+
+    sources: list[Path]
+    dst: Path
+    process: subprocess.CompletedProcess | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
 class SyncABC(ABC):
-    _default_sync_options = []
+    # Stored as tuples so the class level defaults cannot be mutated by accident.
+    # default_sync_options returns a new list that callers are free to modify.
+    _default_sync_options = ()
 
     def __init__(
         self,
         src: str | Path,
         dst: str | Path,
     ) -> None:
-        self.src = self.resolve_dir(src)
-        self.dst = self.resolve_dir(dst)
+        # Made absolute here, so later changes of the working directory do not
+        # change the dirs synced. Their existence is checked on first access (see
+        # src/dst), so syncers only built to inspect their args do not stat them.
+        self._src_path = self.resolve_dir(src, must_exist=False)
+        self._dst_path = self.resolve_dir(dst, must_exist=False)
+
+    @cached_property
+    def src(self) -> Path:
+        return self.resolve_dir(self._src_path)
+
+    @cached_property
+    def dst(self) -> Path:
+        return self.resolve_dir(self._dst_path)
+
+    @cached_property
+    def srcs(self) -> list[Path]:
+        """All source dirs synced by this syncer."""
+        return [self.src]
 
     @property
     def default_sync_options(self) -> list:
-        return self._default_sync_options.copy()
+        return list(self._default_sync_options)
 
     @staticmethod
     def resolve_dir(path: str | Path, must_exist: bool = True) -> Path:
         """
-        Resolves the given path to an absolute path and checks if it points to an existing directory,
-        if required. Raises a ValueError if the path is empty, or if the path does not point to an
-        existing directory when `must_exist` is True.
+        Resolves the given path to an absolute, normalised path and checks if it
+        points to an existing directory, if required. Symlinks in the path are
+        resolved like Path.resolve does, so e.g. `link/..` means the parent of the
+        link target and not the dir containing the link. Raises a ValueError if
+        the path is empty, or if the path does not point to an existing directory
+        when `must_exist` is True. The existence check is made on every call, so
+        dirs removed or unmounted since an earlier call are caught.
 
         Args:
             path (str | Path): The file system path to resolve. Can be a string or a Path object.
@@ -70,18 +226,29 @@ class SyncABC(ABC):
                 + 'If you want to specify current working directory use path = "."'
             )
 
-        path = Path(path) if isinstance(path, str) else path
-        path = path.resolve()
+        # realpath has the semantics of Path.resolve (a lexical abspath would
+        # change the meaning of "link/.."), without building a Path per component.
+        abs_path = os.path.realpath(os.fspath(path))
+        if must_exist and (not os.path.isdir(abs_path)):
+            logger.error("Path %s does not point to an existing directory.", abs_path)
+            raise ValueError(f"{abs_path} does not point to an existing dir!")
 
-        if must_exist and (not path.is_dir()):
-            logger.error("Path %s does not point to an existing directory.", path)
-            raise ValueError(f"{path} does not point to an existing dir!")
+        return Path(abs_path)
 
-        return path
+    @staticmethod
+    def clear_path_cache() -> None:
+        """
+        Clears the cache of the executable lookups made by subprocess_run. Long
+        running processes that install or move sync tools between syncs can
+        call this to have them looked up again.
+        """
+        _which.cache_clear()
 
     @staticmethod
     def filter_args(
-        args: list, unwanted_args: set | None = None, duplicates_allowed: bool = True
+        args: list,
+        unwanted_args: set | frozenset | None = None,
+        duplicates_allowed: bool = True,
     ) -> list:
         """
         Function to remove duplicate args and remove unwanted_args while
@@ -89,7 +256,8 @@ class SyncABC(ABC):
 
         Args:
             args (list): Unfiltered args list
-            unwanted_args (set, optional): Set of unwanted args to remove. Defaults to None.
+            unwanted_args (set | frozenset, optional): Set of unwanted args to remove.
+                Defaults to None.
             duplicates_allowed (bool, optional): Flag to allow or disallow duplicates
 
         Returns:
@@ -99,19 +267,17 @@ class SyncABC(ABC):
         >>> args = ["rsync", "--option1", "rsync", "--option2", "dest", "--option1"]
         >>> SyncABC.filter_args(args, {"rsync", "dest"})
         ['--option1', '--option2', '--option1']
+        >>> SyncABC.filter_args(args, {"rsync", "dest"}, duplicates_allowed=False)
+        ['--option1', '--option2']
         """
-        excl = unwanted_args.copy() if unwanted_args else set()
-        filtered_args = []
+        excl = unwanted_args or ()
+        filtered_args = [arg for arg in args if arg not in excl]
 
-        for arg in args:
-            if arg in excl:
-                continue
+        if duplicates_allowed:
+            return filtered_args
 
-            filtered_args.append(arg)
-            if not duplicates_allowed:
-                excl.add(arg)
-
-        return filtered_args
+        # dict keys keep insertion order, so first positions are kept
+        return list(dict.fromkeys(filtered_args))
 
     def sync(
         self,
@@ -120,6 +286,8 @@ class SyncABC(ABC):
         backup: str | Path = "",
         options: list | None = None,
         subprocess_kwargs: dict | None = None,
+        output_callback: Callable[[str], None] | None = None,
+        error_callback: Callable[[str], None] | None = None,
     ) -> subprocess.CompletedProcess:
         """
         Synchronizes files from the source to the destination directory using the
@@ -133,6 +301,11 @@ class SyncABC(ABC):
             options (list | None, optional): Additional options to pass to the synchronization tool.
                 If None default options will be used (see config.json).
             subprocess_kwargs (dict | None, optional): Additional kwargs to pass to subprocess.run. Defaults to None.
+            output_callback (Callable[[str], None] | None, optional): If given, called with
+                each output line of the sync tool as soon as it is written (see subprocess_run).
+                Defaults to None.
+            error_callback (Callable[[str], None] | None, optional): Like output_callback
+                but for the lines written to stderr. Defaults to None.
 
         Returns:
             subprocess.CompletedProcess: The result from the subprocess.run call.
@@ -159,31 +332,131 @@ class SyncABC(ABC):
         # If delete == True missting files in destination directory will also be backed up.
         if backup and not dry_run:
             backup = self.resolve_dir(backup, must_exist=False)
-            self.backup(backup, delete, subprocess_args)
+            subprocess_args = self.backup(backup, delete, subprocess_args)
 
         # 4. Call subprocess.run with error handling.
-        result = self.subprocess_run(subprocess_args, subprocess_kwargs)
+        result = self.subprocess_run(
+            subprocess_args, subprocess_kwargs, output_callback, error_callback
+        )
 
         # 5. Handle the error code and write to log at debug or error level
         # depending on wheter subprocess call was succesful or not.
-        log_level = "debug"
+        print()
+        self._log_result("sync", result, subprocess_kwargs)
+
+        return result
+
+    async def sync_async(
+        self,
+        delete: bool = False,
+        dry_run: bool = False,
+        backup: str | Path = "",
+        options: list | None = None,
+        subprocess_kwargs: dict | None = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Coroutine version of sync. The sync tool is started with
+        asyncio.create_subprocess_exec, so an event loop can await several
+        syncs (or other work) concurrently without a thread per sync.
+
+        subprocess_kwargs are handled like in subprocess.run, capture_output,
+        input, timeout and text (or universal_newlines) included.
+
+        Args:
+            See sync.
+
+        Returns:
+            subprocess.CompletedProcess: The result of the sync tool call.
+
+        Example:
+        >>> async def sync_all(syncers):  # doctest: +SKIP
+        ...     return await asyncio.gather(*(s.sync_async() for s in syncers))
+        >>> asyncio.run(sync_all([Rsync('dir1', 'dst1'), Rsync('dir2', 'dst2')]))  # doctest: +SKIP
+        """
+        subprocess_args = self.get_args(options, delete, dry_run)
+        subprocess_kwargs = self.get_kwargs(subprocess_kwargs)
+
+        if backup and not dry_run:
+            backup = self.resolve_dir(backup, must_exist=False)
+            subprocess_args = self.backup(backup, delete, subprocess_args)
+
+        result = await self._async_run(subprocess_args, subprocess_kwargs)
+        self._log_result("sync_async", result, subprocess_kwargs)
+
+        return result
+
+    def _log_result(
+        self, method: str, result: subprocess.CompletedProcess, kwargs: dict
+    ) -> None:
+        """
+        Used by sync and sync_async to log the result at debug or error level
+        depending on the return code (see handle_returncode).
+        """
+        log = logger.debug
 
         try:
             self.handle_returncode(result)
         except subprocess.CalledProcessError:
-            log_level = "error"
+            log = logger.error
 
-        print()
-        getattr(logger, log_level)(
-            "%s.sync completed\n  Returncode = %i.\n  Command = %s\n"
+        log(
+            "%s.%s completed\n  Returncode = %i.\n  Command = %s\n"
             "  subprocess kwargs = %s",
             self.__class__.__name__,
+            method,
             result.returncode,
-            str(subprocess_args),
-            str(subprocess_kwargs),
+            str(result.args),
+            str(kwargs),
         )
 
-        return result
+    @staticmethod
+    async def _async_run(
+        args_list: list, subprocess_kwargs: dict
+    ) -> subprocess.CompletedProcess:
+        """
+        Used by sync_async. The asyncio counterpart of subprocess_run, translates
+        the subprocess.run style kwargs to asyncio.create_subprocess_exec.
+        """
+        kwargs = dict(subprocess_kwargs)
+        capture = kwargs.pop("capture_output", False)
+        timeout = kwargs.pop("timeout", None)
+        input_data = kwargs.pop("input", None)
+        # Output is decoded like subprocess.run does in text mode
+        text_flags = (kwargs.pop("text", None), kwargs.pop("universal_newlines", None))
+        encoding = kwargs.pop("encoding", None)
+        errors = kwargs.pop("errors", None)
+        text = any(text_flags) or encoding is not None or errors is not None
+        encoding = encoding or locale.getpreferredencoding(False)
+        errors = errors or "strict"
+
+        if capture:
+            kwargs["stdout"] = kwargs["stderr"] = subprocess.PIPE
+        if input_data is not None:
+            kwargs["stdin"] = subprocess.PIPE
+            if text:
+                input_data = input_data.encode(encoding, errors)
+        executable = _which(args_list[0])
+        if executable is not None:
+            kwargs.setdefault("executable", executable)
+
+        try:
+            proc = await asyncio.create_subprocess_exec(*args_list, **kwargs)
+        except FileNotFoundError as exc:
+            raise SyncABC._tool_not_found(args_list[0]) from exc
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(input_data), timeout
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(args_list, timeout) from None
+
+        if text:
+            stdout = None if stdout is None else stdout.decode(encoding, errors)
+            stderr = None if stderr is None else stderr.decode(encoding, errors)
+        return subprocess.CompletedProcess(args_list, proc.returncode, stdout, stderr)
 
     @staticmethod
     def get_kwargs(kwargs: dict | None) -> dict:
@@ -203,21 +476,35 @@ class SyncABC(ABC):
         >>> SyncABC.get_kwargs(None)
         {}
         """
-        kwargs = kwargs if kwargs else {}
-        excl = {"shell", "check"}
-        return {key: value for key, value in kwargs.items() if not key in excl}
+        kwargs = dict(kwargs) if kwargs else {}
+        kwargs.pop("shell", None)
+        kwargs.pop("check", None)
+        return kwargs
 
     def subprocess_run(
-        self, args_list: list, subprocess_kwargs: dict
+        self,
+        args_list: list,
+        subprocess_kwargs: dict,
+        output_callback: Callable[[str], None] | None = None,
+        error_callback: Callable[[str], None] | None = None,
     ) -> subprocess.CompletedProcess:
         """
         Executes a subprocess with the given arguments and keyword arguments.
         This method is a wrapper around subprocess.run, adding error handling
         for common issues like the executable not being found.
 
+        If output_callback or error_callback is given the process is started with
+        subprocess.Popen instead and its stdout/stderr is read line by line, calling
+        the callback with each line as soon as it is written. This gives feedback
+        during long syncs. Output is only kept in memory (and returned in the
+        CompletedProcess) if capture_output is set, so memory use does not grow
+        with the amount of output otherwise.
+
         Args:
             args_list (list): The list of arguments for subprocess.run. The first argument should be the executables name.
             subprocess_kwargs (dict | None): Additional keyword arguments to pass to subprocess.run.
+            output_callback (Callable[[str], None] | None): Optional. Called with each stdout line.
+            error_callback (Callable[[str], None] | None): Optional. Called with each stderr line.
 
         Returns:
             subprocess.CompletedProcess: The result from the subprocess.run call, which includes attributes
@@ -231,32 +518,194 @@ class SyncABC(ABC):
         >>> kwargs = {'text': True, 'capture_output': True} # doctest: +SKIP
         >>> SyncABC.subprocess_run(args_list=args_list, subprocess_kwargs=kwargs) # doctest: +SKIP
         """
+        # The executable is looked up in PATH once per process, args_list[0] is
+        # kept as is so the returned args are unchanged.
+        executable = _which(args_list[0])
+        if executable is not None and "executable" not in subprocess_kwargs:
+            subprocess_kwargs = {**subprocess_kwargs, "executable": executable}
+
         try:
-            result = subprocess.run(args_list, **subprocess_kwargs, check=False)
+            if output_callback is None and error_callback is None:
+                result = subprocess.run(args_list, **subprocess_kwargs, check=False)
+            else:
+                result = self._stream_run(
+                    args_list, subprocess_kwargs, output_callback, error_callback
+                )
         except FileNotFoundError as exc:
-            cli_program = args_list[0]
-            logger.error(
-                "%s not found. Ensure it is installed and in your PATH.", cli_program
-            )
-            raise FileNotFoundError(
-                f"{cli_program} does not seem to be installed on your system, "
-                + "or path is not set.\n"
-                + f"Install {cli_program} or fix path for program to work."
-            ) from exc
+            raise SyncABC._tool_not_found(args_list[0]) from exc
 
         return result
 
-    def handle_returncode(self, result: subprocess.CompletedProcess):
-        """Should be overwritten by concrete classes when needed!"""
+    @staticmethod
+    def _tool_not_found(cli_program: str) -> FileNotFoundError:
+        """Logs and returns the error raised when cli_program cannot be executed."""
+        logger.error(
+            "%s not found. Ensure it is installed and in your PATH.", cli_program
+        )
+        return FileNotFoundError(
+            f"{cli_program} does not seem to be installed on your system, "
+            + "or path is not set.\n"
+            + f"Install {cli_program} or fix path for program to work."
+        )
+
+    @staticmethod
+    def _stream_run(
+        args_list: list,
+        subprocess_kwargs: dict,
+        output_callback: Callable[[str], None] | None,
+        error_callback: Callable[[str], None] | None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Used by subprocess_run to run args_list while handing each stdout line to
+        output_callback and each stderr line to error_callback. A stream is only
+        piped if it has a callback or capture_output is set, otherwise it is
+        inherited (or redirected as given in subprocess_kwargs). The pipes are
+        read (and input written) in separate threads so none of them can fill up
+        and block the process. input and timeout are handled like in
+        subprocess.run: the process is killed and subprocess.TimeoutExpired
+        raised if it does not finish in time. See subprocess_run.
+        """
+        kwargs = dict(subprocess_kwargs)
+        capture = kwargs.pop("capture_output", False)
+        input_data = kwargs.pop("input", None)
+        timeout = kwargs.pop("timeout", None)
+        if input_data is not None:
+            kwargs["stdin"] = subprocess.PIPE
+        if capture or output_callback is not None:
+            kwargs["stdout"] = subprocess.PIPE
+        if capture or error_callback is not None:
+            kwargs["stderr"] = subprocess.PIPE
+        # Lines are always handed to the callbacks as str
+        kwargs.pop("universal_newlines", None)
+        kwargs["text"] = True
+
+        def read_lines(pipe, callback, lines):
+            for line in pipe:
+                if callback is not None:
+                    callback(line)
+                if capture:
+                    lines.append(line)
+
+        def write_input(pipe):
+            # bytes input (e.g. from sync_filelist) bypasses the text layer
+            try:
+                if isinstance(input_data, bytes):
+                    pipe.buffer.write(input_data)
+                else:
+                    pipe.write(input_data)
+                pipe.close()
+            except BrokenPipeError:
+                pass  # The process exited without reading all input
+
+        stdout_lines, stderr_lines = [], []
+        with subprocess.Popen(args_list, bufsize=1, **kwargs) as proc:
+            workers = []
+            if proc.stdin is not None:
+                workers.append(threading.Thread(target=write_input, args=(proc.stdin,)))
+            for pipe, callback, lines in (
+                (proc.stdout, output_callback, stdout_lines),
+                (proc.stderr, error_callback, stderr_lines),
+            ):
+                if pipe is not None:
+                    workers.append(
+                        threading.Thread(
+                            target=read_lines, args=(pipe, callback, lines)
+                        )
+                    )
+            for worker in workers:
+                worker.daemon = True
+                worker.start()
+
+            try:
+                proc.wait(timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                for worker in workers:
+                    worker.join()
+                raise subprocess.TimeoutExpired(
+                    args_list,
+                    timeout,
+                    "".join(stdout_lines) if capture else None,
+                    "".join(stderr_lines) if capture else None,
+                ) from None
+            for worker in workers:
+                worker.join()
+
+        stdout = "".join(stdout_lines) if capture else None
+        stderr = "".join(stderr_lines) if capture else None
+        return subprocess.CompletedProcess(args_list, proc.returncode, stdout, stderr)
+
+    @classmethod
+    def _run_many(
+        cls,
+        syncers: list["SyncABC"],
+        delete: bool,
+        dry_run: bool,
+        options: list | None,
+        subprocess_kwargs: dict | None,
+        max_workers: int | None,
+        timeout: float | None,
+    ) -> list["SyncResult"]:
+        """
+        Used by the sync_many methods. Runs the sync tool of each syncer in a thread
+        pool (shared by all calls unless max_workers is given) and returns one
+        SyncResult per syncer, in order. Errors are recorded, not raised.
+        """
+        kwargs = cls.get_kwargs(subprocess_kwargs)
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        def run(syncer: SyncABC) -> subprocess.CompletedProcess:
+            args = syncer.get_args(options, delete, dry_run)
+            return syncer.subprocess_run(args, kwargs)
+
+        if max_workers is None:
+            pool = nullcontext(_get_sync_pool())
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+        with pool as executor:
+            futures = [(syncer, executor.submit(run, syncer)) for syncer in syncers]
+
+        results = []
+        for syncer, future in futures:
+            result = SyncResult(syncer.srcs, syncer.dst)
+            try:
+                result.process = future.result()
+                syncer.handle_returncode(result.process)
+            except (OSError, subprocess.SubprocessError) as exc:
+                result.error = exc
+
+            log = logger.debug if result.ok else logger.error
+            log(
+                "%s.sync_many completed for %s\n  Sources = %s\n  Error = %s",
+                cls.__name__,
+                str(result.dst),
+                str([str(src) for src in result.sources]),
+                str(result.error),
+            )
+            results.append(result)
+
+        return results
+
+    @staticmethod
+    def handle_returncode(result: subprocess.CompletedProcess):
+        """
+        Should be overwritten by concrete classes when needed! A staticmethod so
+        results can also be checked without a syncer instance (see
+        utils.incremental).
+        """
         result.check_returncode()
 
     @abstractmethod
-    def backup(self, backup: Path, backup_missing: bool, args: list) -> None:
+    def backup(self, backup: Path, backup_missing: bool, args: list) -> list[str]:
         """Abstract method. The implementation of this in each subclass should back
         up files about to be overwritten. If backup_missing is True then
         files missing from the destination directory should also be backed up.
         Backed up files should be put in the the directory specified by the backup
         Path with the directory structur in the destination folder intact.
+        The args to use for the sync are returned as a new list, args itself
+        should not be modified.
 
         Args:
             backup (Path): Directory where backed up files should be put.
@@ -265,6 +714,9 @@ class SyncABC(ABC):
             backup_missing (bool): True if files existing in destination but not
                 in source should be backed up.
             args (list): args that should be supplied to subprocess.run.
+
+        Returns:
+            list[str]: The args to supply to subprocess.run instead of args.
         """
 
     @abstractmethod
@@ -273,7 +725,408 @@ class SyncABC(ABC):
 
 
 class Rsync(SyncABC):
-    _default_sync_options = RSYNC_DEFAULTS
+    _default_sync_options = tuple(RSYNC_DEFAULTS)
+    # Appended to the default options by fast_defaults (see Rsync(fast=True))
+    _fast_sync_options = (
+        "--whole-file",
+        "--exclude=__pycache__",
+    )
+    # Syncs with default options, no backup and no dry run that transfer at most
+    # this many bytes are done in process instead of spawning rsync.
+    # 0 disables the in process sync. In process syncs print no itemized output
+    # and do not preserve file ownership.
+    inproc_max_bytes = 0
+
+    @classmethod
+    def fast_defaults(cls) -> list[str]:
+        """
+        Returns the default options extended with options tuned for throughput of
+        local syncs.
+
+        - --whole-file: Copies changed files whole instead of computing deltas,
+          which costs more than it saves when both dirs are local.
+        - --exclude=__pycache__: Skips regenerable python byte code caches.
+
+        Returns:
+            list[str]: A new list with the tuned options.
+
+        Example:
+        >>> Rsync.fast_defaults()
+        ['-a', '-i', '-v', '-h', '--whole-file', '--exclude=__pycache__']
+        """
+        return [*cls._default_sync_options, *cls._fast_sync_options]
+
+    def __init__(
+        self,
+        src: str | Path | list[str | Path],
+        dst: str | Path,
+        fast: bool = False,
+    ) -> None:
+        """
+        Args:
+            src (str | Path | list[str | Path]): The source dir, or a list of source
+                dirs. Several sources are synced to dst with a single rsync call,
+                their content is merged into dst. self.src is the first source,
+                self.srcs all of them.
+            dst (str | Path): The destination dir.
+            fast (bool, optional): If True, fast_defaults() are used instead of the
+                default options when no options are passed. Defaults to False.
+        """
+        srcs = list(src) if isinstance(src, (list, tuple)) else [src]
+        if not srcs:
+            raise ValueError("At least one source directory is needed!")
+
+        super().__init__(srcs[0], dst)
+        self._src_paths = [self._src_path] + [
+            self.resolve_dir(path, must_exist=False) for path in srcs[1:]
+        ]
+        self.fast = fast
+
+    # src/dst never change after init so their rsync arg forms are built once,
+    # on first use. Trailing slashes are importent in rsync call for consistent
+    # behaviour.
+    @cached_property
+    def srcs(self) -> list[Path]:
+        return [self.src] + [self.resolve_dir(path) for path in self._src_paths[1:]]
+
+    @cached_property
+    def _src_args(self) -> list[str]:
+        return list(dict.fromkeys(str(path).rstrip("/") + "/" for path in self.srcs))
+
+    @cached_property
+    def _dst_arg(self) -> str:
+        return str(self.dst).rstrip("/") + "/"
+
+    @cached_property
+    def _unwanted_args(self) -> frozenset:
+        return frozenset({"rsync", *self._src_args, self._dst_arg})
+
+    @cached_property
+    def _plain_defaults(self) -> bool:
+        """
+        True if the options used when none are passed (see get_args) do not
+        exclude any files, so a sync with them can be done without rsync.
+        """
+        return not self.fast and not any(
+            arg.startswith(("--exclude", "--include", "--filter"))
+            for arg in self._default_sync_options
+        )
+
+    def sync(
+        self,
+        delete: bool = False,
+        dry_run: bool = False,
+        backup: str | Path = "",
+        options: list | None = None,
+        subprocess_kwargs: dict | None = None,
+        output_callback: Callable[[str], None] | None = None,
+        error_callback: Callable[[str], None] | None = None,
+        prefer_reflink: bool = False,
+    ) -> subprocess.CompletedProcess:
+        """
+        See SyncABC.sync. If inproc_max_bytes is set and a single source is synced
+        with the default options (not fast, without excludes or filters) without
+        backup, dry run, subprocess_kwargs or callbacks, small syncs are done in
+        process (see _inproc_sync) instead of spawning rsync.
+
+        If prefer_reflink is True, a single source is synced to an empty dst with the
+        default options (not fast, without excludes or filters) without delete, backup
+        or dry run, and src and dst are on the same file system supporting copy on
+        write clones (e.g. Btrfs or XFS), `cp --reflink=auto -a` is used instead of
+        rsync. Files are then cloned instead of copied, which takes about the same
+        time regardless of file size. cp copies every file, so dsts with content are
+        always synced by rsync, which skips unchanged files.
+        """
+        if (
+            prefer_reflink
+            and len(self._src_args) == 1
+            and options is None
+            and self._plain_defaults
+            and not (delete or dry_run or backup)
+            and os.stat(self.src).st_dev == os.stat(self.dst).st_dev
+            and _is_empty_dir(self.dst)
+            and _supports_reflink(self.dst)
+        ):
+            # "src/." copies the content of src like the trailing slash in rsync
+            args = [
+                "cp",
+                "--reflink=auto",
+                "-a",
+                self._src_args[0] + ".",
+                self._dst_arg,
+            ]
+            kwargs = self.get_kwargs(subprocess_kwargs)
+            result = self.subprocess_run(args, kwargs, output_callback, error_callback)
+            self._log_result("sync (cp --reflink)", result, kwargs)
+            return result
+
+        if (
+            self.inproc_max_bytes
+            and len(self._src_args) == 1
+            and options is None
+            and self._plain_defaults
+            and not backup
+            and not dry_run
+            # There is no process for these to apply to, so rsync is used
+            and not subprocess_kwargs
+            and output_callback is None
+            and error_callback is None
+        ):
+            result = self._inproc_sync(delete)
+            if result is not None:
+                return result
+
+        return super().sync(
+            delete,
+            dry_run,
+            backup,
+            options,
+            subprocess_kwargs,
+            output_callback,
+            error_callback,
+        )
+
+    def sync_filelist(
+        self,
+        files: Iterable[str | Path],
+        dry_run: bool = False,
+        backup: str | Path = "",
+        options: list | None = None,
+        subprocess_kwargs: dict | None = None,
+    ) -> subprocess.CompletedProcess:
+        """
+        Syncs only the given files from src to dst. The paths are passed to rsync on
+        stdin (--files-from=- --from0), so rsync does not walk the trees. Useful
+        when the changed files are already known, e.g. from a DirComparator
+        comparison or file system notifications.
+
+        Note that --files-from implies --relative, and that -a does not recurse into
+        listed directories (add -r to options for that). Extraneous files are
+        never deleted.
+
+        Args:
+            files (Iterable[str | Path]): Paths relative to src.
+            dry_run (bool, optional): See sync. Defaults to False.
+            backup (str | Path, optional): See sync. Defaults to "".
+            options (list | None, optional): See sync. Defaults to None.
+            subprocess_kwargs (dict | None, optional): See sync. Input is set by
+                this method. Defaults to None.
+
+        Returns:
+            subprocess.CompletedProcess: The result from the subprocess.run call.
+
+        Raises:
+            ValueError: If the syncer has several sources.
+
+        Example:
+        >>> rsync = Rsync('tests/linux_dirs/source', '/tmp/destination') # doctest: +SKIP
+        >>> rsync.sync_filelist(['file1.txt', 'dir1/file2.txt']) # doctest: +SKIP
+        """
+        if len(self._src_args) != 1:
+            raise ValueError("sync_filelist needs a single source directory!")
+
+        if options is None:
+            options = self._default_sync_options
+        options = [*options, "--files-from=-", "--from0"]
+
+        kwargs = self.get_kwargs(subprocess_kwargs)
+        file_list = "\0".join(os.fspath(path) for path in files)
+        text_mode = any(
+            kwargs.get(key) for key in ("text", "universal_newlines", "encoding")
+        )
+        kwargs["input"] = file_list if text_mode else os.fsencode(file_list)
+
+        return self.sync(False, dry_run, backup, options, kwargs)
+
+    @classmethod
+    def sync_many(
+        cls,
+        pairs: Iterable[tuple[str | Path, str | Path]],
+        delete: bool = False,
+        dry_run: bool = False,
+        options: list | None = None,
+        subprocess_kwargs: dict | None = None,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+    ) -> list["SyncResult"]:
+        """
+        Synchronizes several (src, dst) pairs with as few rsync processes as possible.
+        Pairs are grouped by destination and each group is synced with a single
+        `rsync [options] src1/ src2/ ... dst/` call, so the process spawn is paid
+        once per destination instead of once per pair. The rsync calls of
+        different destinations run concurrently in a thread pool (shared by all
+        sync_many calls unless max_workers is given), rsync does the work so
+        threads are not limited by the GIL.
+
+        A failing rsync call does not affect the others, its error is recorded
+        in the returned SyncResult instead of being raised.
+
+        Note that with several sources per destination the content of all sources
+        is merged into the destination, and with delete=True only entries missing
+        from all of the sources are deleted.
+
+        Args:
+            pairs (Iterable[tuple[str | Path, str | Path]]): The (src, dst) pairs to sync.
+            delete (bool, optional): See sync. Defaults to False.
+            dry_run (bool, optional): See sync. Defaults to False.
+            options (list | None, optional): See sync. Defaults to None.
+            subprocess_kwargs (dict | None, optional): See sync. Defaults to None.
+            max_workers (int | None, optional): Max number of concurrent rsync calls.
+                If given a pool of its own is used for this call. Defaults to None,
+                meaning the shared pool of twice the cpu count threads.
+            timeout (float | None, optional): Seconds after which an rsync call is
+                killed and recorded as failed. Defaults to None (no timeout).
+
+        Returns:
+            list[SyncResult]: One result per destination, in the order the
+                destinations first appear in pairs.
+
+        Raises:
+            ValueError: If any src or dst is not an existing directory.
+
+        Example:
+        >>> pairs = [('dir1', 'backup'), ('dir2', 'backup'), ('dir3', 'other')] # doctest: +SKIP
+        >>> results = Rsync.sync_many(pairs, dry_run=True) # doctest: +SKIP
+        >>> [result.ok for result in results] # doctest: +SKIP
+        [True, True]
+        """
+        groups = {}
+        for src, dst in pairs:
+            groups.setdefault(cls.resolve_dir(dst), []).append(src)
+        if not groups:
+            return []
+        # One multi source syncer per destination
+        syncers = [cls(srcs, dst) for dst, srcs in groups.items()]
+
+        return cls._run_many(
+            syncers, delete, dry_run, options, subprocess_kwargs, max_workers, timeout
+        )
+
+    def _inproc_sync(self, delete: bool) -> subprocess.CompletedProcess | None:
+        """
+        Syncs self.src to self.dst in the python process, without spawning rsync.
+        Uses DirComparator to find new, changed and (if delete) extraneous entries.
+        Like rsync's quick check, mutual files count as changed unless their size
+        and mtime are exactly equal. New files are copied with shutil.copy2.
+        Changed files are patched with librsync deltas if librsync is installed,
+        otherwise copied with shutil.copy2. The metadata of new dirs is copied last,
+        so adding their files does not change their mtimes.
+
+        Only plain trees are handled: if the comparison contains anything but
+        regular files and directories, type mismatches, unknown statuses, or more
+        than inproc_max_bytes bytes to transfer, nothing is done and None is
+        returned so the caller can fall back to rsync.
+
+        Args:
+            delete (bool): If True, delete extraneous files from dst.
+
+        Returns:
+            subprocess.CompletedProcess | None: A CompletedProcess with returncode 0
+                and the equivalent rsync args, or None if the sync was not handled.
+        """
+        comparator = DirComparator(self.src, self.dst, "src", "dst")
+        comparator.compare_directories(
+            unilateral_compare=not delete, include_equal_entries=True
+        )
+        comparator.expand_dirs()
+
+        new_dirs, new_files, changed_files, extraneous = [], [], [], []
+        # Equal within DirComparator's mtime tolerance, checked exactly below
+        unchanged_files = []
+        results = (
+            (dct_name, ftype, fstatus, entries)
+            for dct_name, main_dct in comparator.dir_comparison.items()
+            for ftype, type_dct in main_dct.items()
+            for fstatus, entries in type_dct.items()
+        )
+        for dct_name, ftype, fstatus, entries in results:
+            if ftype not in (FileType.FILE, FileType.DIR) or (
+                fstatus & (FileStatus.MISMATCHED | FileStatus.UNKNOWN)
+            ):
+                return None
+
+            if dct_name == "src" and ftype == FileType.DIR:
+                new_dirs.extend(entries)
+            elif dct_name == "src":
+                new_files.extend(entries)
+            elif dct_name == "dst":
+                extraneous.extend(entries)
+            elif ftype == FileType.FILE and FileStatus.CHANGED in fstatus:
+                changed_files.extend(entries)
+            elif ftype == FileType.FILE:
+                unchanged_files.extend(entries)
+
+        for entry in unchanged_files:
+            src_stats = os.stat(self.src / entry)
+            dst_stats = os.stat(self.dst / entry)
+            if (
+                src_stats.st_size != dst_stats.st_size
+                or src_stats.st_mtime_ns != dst_stats.st_mtime_ns
+            ):
+                changed_files.append(entry)
+
+        transfer_size = sum(
+            os.path.getsize(self.src / entry) for entry in new_files + changed_files
+        )
+        if transfer_size > self.inproc_max_bytes:
+            return None
+
+        # Sorting puts parent dirs before their children
+        new_dirs.sort()
+        for entry in new_dirs:
+            (self.dst / entry).mkdir(exist_ok=True)
+        self._transfer_files(new_files, changed_files)
+        # Reverse order deletes children before their parent dirs
+        for entry in sorted(extraneous, reverse=True):
+            path = self.dst / entry
+            if path.is_dir():
+                shutil.rmtree(path)
+            elif path.exists():
+                path.unlink()
+        for entry in new_dirs:
+            shutil.copystat(self.src / entry, self.dst / entry)
+
+        logger.debug(
+            "%s._inproc_sync completed. %i bytes transferred in process.",
+            self.__class__.__name__,
+            transfer_size,
+        )
+        result = subprocess.CompletedProcess(self.get_args(None, delete, False), 0)
+        self._log_result("_inproc_sync", result, {})
+        return result
+
+    def _transfer_files(self, new_files: list[str], changed_files: list[str]) -> None:
+        """
+        Used by _inproc_sync. Copies new_files to dst with shutil.copy2 and
+        updates changed_files in dst (see _patch_file). Entries are relative to
+        src and dst.
+        """
+        for entry in new_files:
+            shutil.copy2(self.src / entry, self.dst / entry)
+        for entry in changed_files:
+            self._patch_file(self.src / entry, self.dst / entry)
+
+    @staticmethod
+    def _patch_file(src_file: Path, dst_file: Path) -> None:
+        """
+        Updates dst_file to the content of src_file, preserving src_file metadata.
+        With librsync installed only the delta between the files is applied
+        (written to a temporary file that replaces dst_file), otherwise
+        src_file is copied with shutil.copy2.
+        """
+        if librsync is None:
+            shutil.copy2(src_file, dst_file)
+            return
+
+        tmp_file = dst_file.with_name(f".{dst_file.name}.py_backup_tmp")
+        with open(dst_file, "rb") as old, open(src_file, "rb") as new:
+            delta = librsync.delta(new, librsync.signature(old))
+            old.seek(0)
+            with open(tmp_file, "wb") as out:
+                librsync.patch(old, delta, out)
+
+        os.replace(tmp_file, dst_file)
+        shutil.copystat(src_file, dst_file)
 
     def get_args(self, options: list | None, delete: bool, dry_run: bool) -> list[str]:
         """
@@ -283,6 +1136,8 @@ class Rsync(SyncABC):
 
         Args:
             options (list): Additional options to pass to the rsync command.
+                If None the default options are used, or fast_defaults() if the
+                syncer was created with fast=True.
             delete (bool): If True, include the --delete option to remove files from
                            the destination not present in the source.
             dry_run (bool): If True, include the --dry-run option to simulate the command
@@ -301,22 +1156,18 @@ class Rsync(SyncABC):
         >>> rsync.get_args(['-ai'], delete=True, dry_run=False) # doctest: +ELLIPSIS
         ['rsync', '-ai', '--delete', ..., ...]
         """
-        # Trailing slashes are importent in rsync call for consistent behaviour
-        options = options.copy() if options is not None else self.default_sync_options
-        src = str(self.src) + "/"
-        dst = str(self.dst) + "/"
-
-        if delete:
-            options.append("--delete")
-        if dry_run:
-            options.append("--dry-run")
+        if options is None:
+            if self.fast:
+                options = self._default_sync_options + self._fast_sync_options
+            else:
+                options = self._default_sync_options
 
-        args = self.filter_args(options, {"rsync", src, dst})
-        return ["rsync"] + args + [src, dst]
+        args = _rsync_options(tuple(options), delete, dry_run, self._unwanted_args)
+        return ["rsync", *args, *self._src_args, self._dst_arg]
 
-    def backup(self, backup: Path, _, args: list) -> None:
+    def backup(self, backup: Path, _, args: list) -> list[str]:
         """
-        Modifies the `args` list for an rsync command to include backup options.
+        Returns a copy of the `args` list for an rsync command with backup options.
         Specifically, it removes any existing '--backup' or '--backup-dir=' options
         and adds them back with the specified backup directory.
         This ensures predictable backup options are provided for later subprocess.run calls.
@@ -324,35 +1175,254 @@ class Rsync(SyncABC):
         Args:
             backup (Path): The path to the directory where backups should be stored.
             _ (ignore): Placeholder for compatibility with sync method in SyncABC.
-            args (list): The list of existing rsync command arguments to be modified.
+            args (list): The list of existing rsync command arguments, not modified.
+                Must end with the src args and the dst arg (see get_args).
+
+        Returns:
+            list[str]: The new args list.
 
         Examples:
         >>> from pathlib import Path
         >>> args = ['rsync', '-av', '--delete', 'tests/linux_dirs/source/', 'tests/linux_dirs/destination/']
         >>> backup = Path('tests/linux_dirs/backup_dir')
         >>> rsync = Rsync('tests/linux_dirs/source', 'tests/linux_dirs/destination')
-        >>> rsync.backup(backup, None, args)
-        >>> args  # doctest: +ELLIPSIS
+        >>> rsync.backup(backup, None, args)  # doctest: +ELLIPSIS
         ['rsync', '-av', '--delete', '--backup', '--backup-dir=...backup_dir', '...tests/linux_dirs/source/', '...tests/linux_dirs/destination/']
 
         Demonstrates removal of existing backup options before adding new ones:
         >>> args = ['rsync', '-av', '--delete', '--backup', '--backup-dir=old/dir', 'tests/linux_dirs/source/', 'tests/linux_dirs/destination/']
-        >>> rsync.backup(backup, None, args)
-        >>> args  # doctest: +ELLIPSIS
+        >>> rsync.backup(backup, None, args)  # doctest: +ELLIPSIS
         ['rsync', '-av', '--delete', '--backup', '--backup-dir=...backup_dir...', '...source...', '...tests...']
         """
-        for i in range(len(args) - 1, -1, -1):
-            arg = args[i]
+        # The src args and the dst arg are kept last
+        pos = len(args) - len(self._src_args) - 1
+        return [
+            *(
+                arg
+                for arg in args[:pos]
+                if arg != "--backup" and not arg.startswith("--backup-dir=")
+            ),
+            "--backup",
+            f"--backup-dir={backup}",
+            *args[pos:],
+        ]
+
+
+@lru_cache(maxsize=1)
+def _uring_available() -> bool:
+    """Used by IoUringSync. Checks once if an io_uring ring can be set up."""
+    if liburing is None:
+        return False
+
+    ring = liburing.Ring()
+    try:
+        liburing.io_uring_queue_init(1, ring)
+    except OSError as exc:
+        logger.debug("io_uring not available, using rsync:\n%s", exc)
+        return False
+
+    liburing.io_uring_queue_exit(ring)
+    return True
+
+
+class IoUringSync(Rsync):
+    """
+    Rsync for local syncs that does the work in process, copying files through
+    io_uring instead of spawning rsync. The file reads and writes of up to
+    queue_depth chunks (of chunk_size bytes) are submitted with a single system
+    call, which saves most system calls and context switches when syncing many
+    small files.
+
+    New and changed entries are found like in Rsync._inproc_sync, whole files
+    are copied (as rsync does for local syncs). Syncs with options, backup or
+    dry run, trees with anything but regular files and directories, syncs
+    transferring more than inproc_max_bytes (64 MiB unless set), and syncs on
+    systems without io_uring (liburing not installed, not Linux or a kernel
+    without io_uring) are done by rsync as usual.
+
+    Like Rsync._inproc_sync, syncs done in process do not print rsync's
+    itemized output and do not preserve file ownership.
+
+    Example:
+    >>> syncer = IoUringSync('tests/linux_dirs/source', '/tmp/destination') # doctest: +SKIP
+    >>> syncer.sync(delete=True) # doctest: +SKIP
+    """
+
+    queue_depth = 64
+    chunk_size = 1 << 20
+    # Set through inproc_max_bytes
+    _inproc_limit = 64 << 20
 
-            if arg == "--backup" or arg.startswith("--backup-dir="):
-                del args[i]
+    @property
+    def inproc_max_bytes(self) -> int:
+        """
+        See Rsync.inproc_max_bytes. 64 MiB unless set, always 0 (rsync is used)
+        when io_uring is not available.
+        """
+        if not _uring_available():
+            return 0
+        return self._inproc_limit
 
-        args.insert(-2, "--backup")
-        args.insert(-2, "--backup-dir=" + str(backup))
+    @inproc_max_bytes.setter
+    def inproc_max_bytes(self, value: int) -> None:
+        self._inproc_limit = value
+
+    def _transfer_files(self, new_files: list[str], changed_files: list[str]) -> None:
+        """
+        Copies new_files and changed_files from src to dst through io_uring (see
+        _uring_copy), then copies their metadata with shutil.copystat.
+        """
+        entries = new_files + changed_files
+        ring = liburing.Ring()
+        liburing.io_uring_queue_init(self.queue_depth, ring)
+        try:
+            self._uring_copy(ring, entries)
+        finally:
+            liburing.io_uring_queue_exit(ring)
+
+        for entry in entries:
+            shutil.copystat(self.src / entry, self.dst / entry)
+
+    def _uring_copy(self, ring: "liburing.Ring", entries: list[str]) -> None:
+        """
+        Copies the content of entries (relative to src and dst). The files are
+        split into chunks that are read and written in batches of queue_depth
+        chunks, first all reads of a batch and then all writes. Short reads are
+        completed with os.pread before the chunks are written. At most
+        queue_depth files are kept open at a time.
+        """
+        batch, done_fds = [], []
+
+        def flush():
+            if not batch:
+                return
+            bufs = [buf for _, _, _, buf in batch]
+            read_sizes = self._uring_submit(
+                ring,
+                [
+                    (liburing.io_uring_prep_read, src_fd, buf, offset)
+                    for src_fd, _, offset, buf in batch
+                ],
+            )
+            for (src_fd, _, offset, buf), size in zip(batch, read_sizes):
+                # Short reads are completed, only EOF (the source file shrunk
+                # since it was stat'ed) may leave a chunk partly filled
+                while 0 < size < len(buf):
+                    data = os.pread(src_fd, len(buf) - size, offset + size)
+                    if not data:
+                        break
+                    buf[size : size + len(data)] = data
+                    size += len(data)
+                del buf[size:]
+            write_sizes = self._uring_submit(
+                ring,
+                [
+                    (liburing.io_uring_prep_write, dst_fd, buf, offset)
+                    for _, dst_fd, offset, buf in batch
+                ],
+            )
+            if write_sizes != [len(buf) for buf in bufs]:
+                raise OSError("Short write while copying files through io_uring")
+            batch.clear()
+
+        def close_done():
+            flush()
+            for fd in done_fds:
+                os.close(fd)
+            done_fds.clear()
+
+        try:
+            for entry in entries:
+                src_fd = os.open(self.src / entry, os.O_RDONLY)
+                done_fds.append(src_fd)
+                size = os.fstat(src_fd).st_size
+                dst_fd = os.open(
+                    self.dst / entry, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+                )
+                done_fds.append(dst_fd)
+                for offset in range(0, size, self.chunk_size):
+                    length = min(self.chunk_size, size - offset)
+                    batch.append((src_fd, dst_fd, offset, bytearray(length)))
+                    if len(batch) == self.queue_depth:
+                        flush()
+                # Bounds the number of open files (e.g. for many empty files)
+                if len(done_fds) >= 2 * self.queue_depth:
+                    close_done()
+            flush()
+        finally:
+            for fd in done_fds:
+                os.close(fd)
+
+    @staticmethod
+    def _uring_submit(ring: "liburing.Ring", ops: list[tuple]) -> list[int]:
+        """
+        Used by _uring_copy. Submits ops, (prep_function, fd, buf, offset) tuples,
+        with a single system call, waits for all of them and returns their results
+        in order. Raises the first error after all completions are reaped.
+        """
+        for i, (prep, fd, buf, offset) in enumerate(ops):
+            sqe = liburing.io_uring_get_sqe(ring)
+            prep(sqe, fd, buf, offset)
+            liburing.io_uring_sqe_set_data64(sqe, i)
+        liburing.io_uring_submit_and_wait(ring, len(ops))
+
+        results, error = [0] * len(ops), None
+        cqe = liburing.Cqe()
+        for _ in ops:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            try:
+                results[cqe[0].user_data] = cqe[0].res
+            except OSError as exc:
+                error = error or exc
+            liburing.io_uring_cqe_seen(ring, cqe[0])
+
+        if error is not None:
+            raise error
+        return results
 
 
 class Robocopy(SyncABC):
-    _default_sync_options = ROBOCOPY_DEFAULTS
+    _default_sync_options = tuple(ROBOCOPY_DEFAULTS)
+
+    # src/dst never change after init so their robocopy arg forms are built once,
+    # on first use.
+    @cached_property
+    def _src_arg(self) -> str:
+        return str(self.src)
+
+    @cached_property
+    def _dst_arg(self) -> str:
+        return str(self.dst)
+
+    @cached_property
+    def _unwanted_args(self) -> frozenset:
+        return frozenset({"robocopy", self._src_arg, self._dst_arg})
+
+    @classmethod
+    def sync_many(
+        cls,
+        pairs: Iterable[tuple[str | Path, str | Path]],
+        delete: bool = False,
+        dry_run: bool = False,
+        options: list | None = None,
+        subprocess_kwargs: dict | None = None,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+    ) -> list["SyncResult"]:
+        """
+        Synchronizes several (src, dst) pairs with concurrent robocopy calls, see
+        Rsync.sync_many for the arguments and the result. Robocopy cannot take
+        several sources, so there is one call per pair and pairs should not share
+        destinations.
+
+        Example:
+        >>> pairs = [('C:/dir1', 'D:/backup1'), ('C:/dir2', 'D:/backup2')] # doctest: +SKIP
+        >>> results = Robocopy.sync_many(pairs, dry_run=True) # doctest: +SKIP
+        """
+        syncers = [cls(src, dst) for src, dst in pairs]
+        return cls._run_many(
+            syncers, delete, dry_run, options, subprocess_kwargs, max_workers, timeout
+        )
 
     def get_args(self, options: list | None, delete: bool, dry_run: bool) -> list[str]:
         """
@@ -380,24 +1450,23 @@ class Robocopy(SyncABC):
         ['robocopy', ..., ..., '/R:3', '/PURGE']
         """
         options = options.copy() if options is not None else self.default_sync_options
-        src = str(self.src)
-        dst = str(self.dst)
 
         if delete:
             options.append("/PURGE")
         if dry_run:
             options.append("/L")
 
-        args = self.filter_args(options, {"robocopy", src, dst})
-        return ["robocopy"] + [src, dst] + args
+        args = self.filter_args(options, self._unwanted_args)
+        return ["robocopy"] + [self._src_arg, self._dst_arg] + args
 
-    def backup(self, backup: Path, backup_missing: bool, args: list) -> None:
+    def backup(self, backup: Path, backup_missing: bool, args: list) -> list[str]:
         # TODO implement backup functionality
         raise NotImplementedError(
             "The backup function in robocopy is not yet implemented!"
         )
 
-    def handle_returncode(self, result: subprocess.CompletedProcess):
+    @staticmethod
+    def handle_returncode(result: subprocess.CompletedProcess):
         """
         Handles the return code from a subprocess.CompletedProcess object
         for Robocopy operations since robocopy return codes are non standard.
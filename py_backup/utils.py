@@ -3,26 +3,48 @@ Functional interface for py-backup. Works by using the appropriate class in
 syncers.py but abstracts this away from the user.
 """
 
+import json
+import os
 import platform
 import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterable, Iterator
 from .syncers import Rsync, Robocopy
 from .config import CONFIG, CONFIG_PATH
+from .logging_config import get_logger
 
 
 _INCR_BACKUP_PREFIX = "incremental_backup_"
+# Stored in the backup dir of incremental, see _source_fingerprint
+_FINGERPRINT_FILE = ".py_backup_fingerprints.json"
+# The platform does not change while running, so the syncer is picked once
+_OS_TYPE = platform.system()
+_SYNCER_CLASS = {"Linux": Rsync, "Windows": Robocopy}.get(_OS_TYPE)
+# Options of the platform syncer per sync type, e.g. CONFIG["mirror"]["rsync"]
+_SYNC_OPTIONS = (
+    {}
+    if _SYNCER_CLASS is None
+    else {
+        sync_type: tool_options[_SYNCER_CLASS.__name__.lower()]
+        for sync_type, tool_options in CONFIG.items()
+        if _SYNCER_CLASS.__name__.lower() in tool_options
+    }
+)
+
+logger = get_logger(__name__)
 
 
 def folder_backup(
-    source: str | Path,
+    source: str | Path | list[str | Path],
     destination: str | Path,
     delete: bool = False,
     dry_run: bool = False,
     backup_dir: str | Path = "",
     sync_type: str = "defaults",
+    output_callback: Callable[[str], None] | None = None,
 ) -> subprocess.CompletedProcess:
     """
     Performs file synchronization from the source to the destination directory,
@@ -30,8 +52,15 @@ def folder_backup(
     a simplified interface for file synchronization tasks, abstracting away the direct
     interaction with different syncers.
 
+    Several sources can be given as a list, their content is then merged into the
+    destination. On Linux all of them are synced with a single rsync call (see
+    Rsync). Robocopy only takes one source so it is called once per source, which
+    is why several sources cannot be combined with delete on Windows (each call
+    would delete what the previous ones copied).
+
     Parameters:
-    - source (str | Path): The source directory to synchronize from.
+    - source (str | Path | list[str | Path]): The source directory (or directories)
+      to synchronize from.
     - destination (str | Path): The destination directory where files will be synchronized to.
     - delete (bool, optional): If True, deletes files in the destination that are not
       present in the source. This is useful for mirroring directories. Defaults to False.
@@ -42,36 +71,107 @@ def folder_backup(
       Defaults to an empty string, indicating that no backups will be made.
     - sync_type (str, optional): Specifies the type of synchronization to perform, based
       on predefined configurations in config.json. Defaults to "defaults", which uses the
-      default synchronization options.
+      default synchronization options. Use "local" or "lan" for options tuned for fast
+      local disks or fast networks (whole file transfers, multithreaded robocopy).
+    - output_callback (Callable[[str], None] | None, optional): If given, called with each
+      output line of the sync tool as soon as it is written, e.g. to show progress. The
+      output is streamed, not buffered in memory. Defaults to None.
 
     Returns:
     - subprocess.CompletedProcess: The result from the subprocess call to the sync tool,
-      containing information like the exit code and output of the command.
+      containing information like the exit code and output of the command. If robocopy
+      is called once per source, the result of the first failed call (or else the last
+      call) is returned.
 
     Raises:
     - NotImplementedError: If the operating system is not supported.
-    - ValueError: If the specified sync_type is not found in config.json.
+    - ValueError: If the specified sync_type is not found in config.json, if no
+      source or the same source more than once is given, or if several sources are
+      given with delete=True on Windows.
 
     Example:
     >>> folder_backup('/path/to/source', '/path/to/destination', dry_run=True, sync_type="backup") # doctest: +SKIP
+    >>> folder_backup(['/path/to/src1', '/path/to/src2'], '/path/to/destination') # doctest: +SKIP
     """
-    os_to_syncer_map = {"Linux": Rsync, "Windows": Robocopy}
-    os_type = platform.system()
-
-    try:
-        syncer = os_to_syncer_map[os_type](source, destination)
-    except KeyError as exc:
-        raise NotImplementedError(f"Platform {os_type} not supported!") from exc
+    syncer_class = _SYNCER_CLASS
+    if syncer_class is None:
+        raise NotImplementedError(f"Platform {_OS_TYPE} not supported!")
 
     try:
-        options = CONFIG[sync_type][syncer.__class__.__name__.lower()]
+        options = _SYNC_OPTIONS[sync_type]
     except KeyError as exc:
         raise ValueError(
             f"There is no sync type {sync_type} in {CONFIG_PATH}\n"
-            + f"for {syncer.__name__}!"
+            + f"for {syncer_class.__name__}!"
         ) from exc
 
-    return syncer.sync(delete, dry_run, backup_dir, options)
+    sources = list(source) if isinstance(source, (list, tuple)) else [source]
+    if not sources:
+        raise ValueError("At least one source directory is needed!")
+    if len({os.path.abspath(src) for src in sources}) != len(sources):
+        raise ValueError(f"The same source is given more than once in {sources}!")
+    if syncer_class is not Rsync and delete and len(sources) > 1:
+        raise ValueError(
+            f"{syncer_class.__name__} syncs one source per call, several sources "
+            + "cannot be combined with delete!"
+        )
+
+    if syncer_class is Rsync:
+        # One rsync process for all sources
+        syncers = [Rsync(sources, destination)]
+    else:
+        syncers = [syncer_class(src, destination) for src in sources]
+
+    failed = None
+    for syncer in syncers:
+        result = syncer.sync(
+            delete, dry_run, backup_dir, options, output_callback=output_callback
+        )
+        try:
+            syncer.handle_returncode(result)
+        except subprocess.CalledProcessError:
+            failed = failed or result
+
+    return failed or result
+
+
+def folder_backup_many(
+    jobs: Iterable[dict], max_workers: int | None = None
+) -> list[subprocess.CompletedProcess]:
+    """
+    Runs several folder_backup calls concurrently in a thread pool. The sync tools
+    do the work in their own processes, so threads suffice. Jobs should not share
+    destinations (or sources of one job with destinations of another).
+
+    Parameters:
+    - jobs (Iterable[dict]): The keyword arguments of each folder_backup call.
+    - max_workers (int | None, optional): Max number of concurrent folder_backup calls.
+      Defaults to None, meaning the cpu count capped at 8 to not saturate shared
+      disks or remote servers.
+
+    Returns:
+    - list[subprocess.CompletedProcess]: The folder_backup results in the order of jobs.
+
+    Raises:
+    - Any error raised by a folder_backup call, after all calls have completed.
+
+    Example:
+    >>> jobs = [
+    ...     {'source': '/path/to/src1', 'destination': '/path/to/dst1'},
+    ...     {'source': '/path/to/src2', 'destination': '/path/to/dst2', 'delete': True},
+    ... ]
+    >>> results = folder_backup_many(jobs, max_workers=2) # doctest: +SKIP
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    if max_workers is None:
+        max_workers = min(8, os.cpu_count() or 1, len(jobs))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(folder_backup, **job) for job in jobs]
+
+    return [future.result() for future in futures]
 
 
 def backup(source: str, destination: str, dry_run: bool, backup_dir: str = ""):
@@ -105,7 +205,12 @@ def mirror(source: str, destination: str, dry_run: bool, backup_dir: str = ""):
 
 
 def incremental(
-    source: str, destination: str, dry_run: bool, backup_dir: str, num_incremental: int
+    source: str,
+    destination: str,
+    dry_run: bool,
+    backup_dir: str,
+    num_incremental: int,
+    skip_unchanged: bool = False,
 ):
     """
     Performs an incremental backup from the source directory to the destination directory,
@@ -125,6 +230,11 @@ def incremental(
       new backup is stored in a subdirectory named with the current timestamp.
     - num_incremental (int): The maximum number of incremental backup directories to retain.
       Older backups beyond this limit are deleted, starting with the oldest.
+    - skip_unchanged (bool, optional): If True, the sync is skipped when the source has
+      not changed since the last successful backup to the same destination (see
+      _source_fingerprint). Scanning only the source is much cheaper than a sync tool
+      run that scans both trees. Changes made directly in the destination are not
+      detected. Defaults to False.
 
     Raises (based on potential raised errors in folder_backup call):
     - NotImplementedError: If the operating system is not supported by the underlying sync tools.
@@ -136,7 +246,19 @@ def incremental(
     backup_dir_path = Path(backup_dir)
     nested_dir_path = _get_nested_path(backup_dir_path, datetime.now())
 
-    folder_backup(
+    fingerprint = None
+    if skip_unchanged:
+        key = f"{os.path.abspath(source)} -> {os.path.abspath(destination)}"
+        fingerprints = _load_fingerprints(backup_dir_path)
+        fingerprint = _source_fingerprint(source)
+        if fingerprints.get(key) == fingerprint:
+            logger.info("No changes in %s since the last backup, skipping.", source)
+            # num_incremental may have been lowered since the last backup
+            if backup_dir_path.is_dir():
+                _prune_backups(backup_dir_path, num_incremental, dry_run)
+            return
+
+    result = folder_backup(
         source,
         destination,
         delete=True,
@@ -145,12 +267,117 @@ def incremental(
         sync_type="incremental",
     )
 
+    if fingerprint is not None and not dry_run and _sync_succeeded(result):
+        fingerprints[key] = fingerprint
+        _save_fingerprints(backup_dir_path, fingerprints)
+
     if nested_dir_path.is_dir():
-        for old_backup in _get_old_backups(backup_dir_path, num_incremental):
-            if dry_run:
-                print(f"Dry run: would delete {old_backup}")
-            else:
-                shutil.rmtree(old_backup)
+        _prune_backups(backup_dir_path, num_incremental, dry_run)
+
+
+def _prune_backups(backup_path: Path, num_incremental: int, dry_run: bool) -> None:
+    """
+    Removes the incremental backups in backup_path beyond the num_incremental
+    newest (see _get_old_backups). With dry_run they are only printed.
+    """
+    old_backups = list(_get_old_backups(backup_path, num_incremental))
+    if dry_run:
+        if old_backups:
+            print("\n".join(f"Dry run: would delete {path}" for path in old_backups))
+    elif old_backups:
+        _remove_trees(old_backups)
+
+
+def _sync_succeeded(result: subprocess.CompletedProcess) -> bool:
+    """
+    Returns True if result is a successful call of the platform sync tool, e.g.
+    robocopy return codes 1-7 also mean success (see handle_returncode).
+    """
+    try:
+        _SYNCER_CLASS.handle_returncode(result)
+    except subprocess.CalledProcessError:
+        return False
+    return True
+
+
+def _remove_trees(paths: list[Path]) -> None:
+    """
+    Removes the directory trees at paths with shutil.rmtree. Several trees are
+    removed in parallel threads since the removal is mostly waiting on the
+    filesystem.
+
+    Parameters:
+    - paths (list[Path]): The directories to remove.
+
+    Raises:
+    - OSError: If a tree could not be removed.
+    """
+    if len(paths) <= 1:
+        for path in paths:
+            shutil.rmtree(path)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(paths), 8)) as executor:
+        # list() re-raises the first error from the workers
+        list(executor.map(shutil.rmtree, paths))
+
+
+def _source_fingerprint(source: str | Path) -> list[int]:
+    """
+    Returns [entry count, total file size, newest mtime in ns, newest ctime in ns]
+    of the tree at source. Creating, deleting or renaming entries changes the mtime
+    of their parent dir and modifying a file changes its own. Restoring an mtime
+    (e.g. cp -p or touch -r) still sets the inode change time (ctime) to now, so an
+    unchanged fingerprint means an unchanged tree. Symlinks are not followed.
+
+    Limitation: On Windows st_ctime is the creation time, so a modified file
+    whose mtime was restored is only detected if its size changed.
+
+    Parameters:
+    - source (str | Path): The root directory of the tree.
+
+    Returns:
+    - list[int]: The fingerprint, a list to compare equal to its JSON round trip.
+
+    >>> _source_fingerprint('tests/backups/incr_backups')[0] # 5 dirs with one file each
+    10
+    """
+    count, total_size = 0, 0
+    root_stat = os.stat(source)
+    newest, newest_change = root_stat.st_mtime_ns, root_stat.st_ctime_ns
+    stack = [source]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                stat = entry.stat(follow_symlinks=False)
+                count += 1
+                newest = max(newest, stat.st_mtime_ns)
+                newest_change = max(newest_change, stat.st_ctime_ns)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    total_size += stat.st_size
+
+    return [count, total_size, newest, newest_change]
+
+
+def _load_fingerprints(backup_path: Path) -> dict:
+    """Returns the fingerprints stored in backup_path, empty if there are none."""
+    try:
+        with open(backup_path / _FINGERPRINT_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_fingerprints(backup_path: Path, fingerprints: dict) -> None:
+    """Stores fingerprints in backup_path. Failing to do so only disables skipping."""
+    try:
+        backup_path.mkdir(parents=True, exist_ok=True)
+        with open(backup_path / _FINGERPRINT_FILE, "w", encoding="utf-8") as f:
+            json.dump(fingerprints, f)
+    except OSError as exc:
+        logger.warning("Could not store source fingerprints:\n%s", exc)
 
 
 def _get_nested_path(backup_path: Path, backup_time: datetime) -> Path:
@@ -171,9 +398,13 @@ def _get_nested_path(backup_path: Path, backup_time: datetime) -> Path:
     >>> _get_nested_path(backup_path, backup_time)
     PosixPath('/example/backup/incremental_backup_230101_120000')
     """
-    nested_dir_name = f"{_INCR_BACKUP_PREFIX}{backup_time.strftime('%y%m%d_%H%M%S')}"
-    nested_dir = backup_path / nested_dir_name
-    return nested_dir
+    t = backup_time
+    # Same as strftime("%y%m%d_%H%M%S") without the locale aware formatting
+    stamp = (
+        f"{t.year % 100:02d}{t.month:02d}{t.day:02d}"
+        f"_{t.hour:02d}{t.minute:02d}{t.second:02d}"
+    )
+    return backup_path / f"{_INCR_BACKUP_PREFIX}{stamp}"
 
 
 def _get_old_backups(backup_path: Path, num_incremental: int) -> Iterator[Path]:
@@ -193,7 +424,13 @@ def _get_old_backups(backup_path: Path, num_incremental: int) -> Iterator[Path]:
     >>> list(_get_old_backups(path, 4)) # tests directory contains 5 nested dirs.
     [PosixPath('tests/backups/incr_backups/incremental_backup_230102_120000')]
     """
-    incremental_backups = sorted(backup_path.glob(f"{_INCR_BACKUP_PREFIX}*"))
-
-    for old_backup in incremental_backups[:-num_incremental]:
-        yield old_backup
+    # Names are filtered with scandir instead of Path.glob, no Path per entry
+    with os.scandir(backup_path) as it:
+        incremental_backups = sorted(
+            entry.name
+            for entry in it
+            if entry.name.startswith(_INCR_BACKUP_PREFIX) and entry.is_dir()
+        )
+
+    for name in incremental_backups[:-num_incremental]:
+        yield backup_path / name
@@ -19,6 +19,11 @@ setup(
         ],
     },
     install_requires=[],
+    extras_require={
+        "blake3": ["blake3"],
+        "librsync": ["python-librsync"],
+        "liburing": ["liburing; sys_platform == 'linux'"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
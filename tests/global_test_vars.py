@@ -1,14 +1,13 @@
-import platform
+import os
+import sys
 from pathlib import Path
+from types import MappingProxyType
 from py_backup.comparer import FileStatus, FileType
 
-user_platform = platform.system().lower()
-if user_platform == "linux":
-    TEST_DATA_DIR = Path(__file__).parent / "linux_dirs"
-elif user_platform == "windows":
-    TEST_DATA_DIR = Path(__file__).parent / "windows_dirs"
-else:
+_TEST_DIR_NAME = {"linux": "linux_dirs", "win32": "windows_dirs"}.get(sys.platform)
+if _TEST_DIR_NAME is None:
     raise NotImplementedError("Platforms other then windows/linux not implemented")
+TEST_DATA_DIR = Path(__file__).parent / _TEST_DIR_NAME
 
 assert TEST_DATA_DIR.is_dir()
 
@@ -19,76 +18,93 @@ assert DESTINATION.is_dir()
 assert SOURCE.is_dir()
 assert not NON_EXISTING_DIR.exists()
 
-COMMON_DIR = {
-    str(Path(DESTINATION / "common_dir/dst_file.txt")),
-    str(Path(DESTINATION / "common_dir/common_inner_dir/inner_dst_file.txt")),
-    str(Path(SOURCE / "common_dir/source_file.txt")),
-    str(Path(SOURCE / "common_dir/common_inner_dir/inner_src_file.txt")),
-    str(Path(SOURCE / "common_dir/common_inner_dir/common_inner_file.txt")),
-    str(Path(DESTINATION / "common_dir/common_inner_dir/common_inner_file.txt")),
-    str(Path(SOURCE / "common_dir")),
-    str(Path(DESTINATION / "common_dir")),
-    str(Path(SOURCE / "common_dir/common_inner_dir")),
-    str(Path(DESTINATION / "common_dir/common_inner_dir")),
-    str(Path(SOURCE / "common_dir/loop_link")),
-    str(Path(DESTINATION / "common_dir/loop_link")),
-}
 
-RESULT_DST_SRC = {
-    "dst": {
-        FileType.FILE: {
-            FileStatus.UNIQUE: {
-                str(Path("delete_file.txt")),
-                str(Path("common_dir/dst_file.txt")),
-                str(Path("common_dir/common_inner_dir/inner_dst_file.txt")),
-                str(Path("inner_dst_dir/inner_dst_file")),
-                str(Path("inner_dst_dir/nested_inner_dst_dir/nested_inner_dst_file")),
-                str(Path("src_file_dst_dir/.keep")),
+def _p(path: str) -> str:
+    # Expected paths are written POSIX style and use the platform separator
+    return path.replace("/", os.sep)
+
+
+def _freeze(obj):
+    # Shared expected results are made immutable, so tests can not modify them
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(val) for key, val in obj.items()})
+    return frozenset(obj)
+
+
+COMMON_DIR = frozenset(
+    {
+        _p(f"{DESTINATION}/common_dir/dst_file.txt"),
+        _p(f"{DESTINATION}/common_dir/common_inner_dir/inner_dst_file.txt"),
+        _p(f"{SOURCE}/common_dir/source_file.txt"),
+        _p(f"{SOURCE}/common_dir/common_inner_dir/inner_src_file.txt"),
+        _p(f"{SOURCE}/common_dir/common_inner_dir/common_inner_file.txt"),
+        _p(f"{DESTINATION}/common_dir/common_inner_dir/common_inner_file.txt"),
+        _p(f"{SOURCE}/common_dir"),
+        _p(f"{DESTINATION}/common_dir"),
+        _p(f"{SOURCE}/common_dir/common_inner_dir"),
+        _p(f"{DESTINATION}/common_dir/common_inner_dir"),
+        _p(f"{SOURCE}/common_dir/loop_link"),
+        _p(f"{DESTINATION}/common_dir/loop_link"),
+    }
+)
+
+RESULT_DST_SRC = _freeze(
+    {
+        "dst": {
+            FileType.FILE: {
+                FileStatus.UNIQUE: {
+                    _p("delete_file.txt"),
+                    _p("common_dir/dst_file.txt"),
+                    _p("common_dir/common_inner_dir/inner_dst_file.txt"),
+                    _p("inner_dst_dir/inner_dst_file"),
+                    _p("inner_dst_dir/nested_inner_dst_dir/nested_inner_dst_file"),
+                    _p("src_file_dst_dir/.keep"),
+                },
+                FileStatus.MISMATCHED: {_p("src_dir_dst_file")},
             },
-            FileStatus.MISMATCHED: {str(Path("src_dir_dst_file"))},
-        },
-        FileType.DIR: {
-            FileStatus.UNIQUE: {
-                str(Path("inner_dst_dir")),
-                str(Path("inner_dst_dir/nested_inner_dst_dir")),
+            FileType.DIR: {
+                FileStatus.UNIQUE: {
+                    _p("inner_dst_dir"),
+                    _p("inner_dst_dir/nested_inner_dst_dir"),
+                },
+                FileStatus.MISMATCHED: {_p("src_file_dst_dir")},
             },
-            FileStatus.MISMATCHED: {str(Path("src_file_dst_dir"))},
         },
-    },
-    "src": {
-        FileType.FILE: {
-            FileStatus.UNIQUE: {
-                str(Path("nested_src_dir/nested_src_file.txt")),
-                str(Path("src_dir_dst_file/.keep")),
-                str(Path("common_dir/source_file.txt")),
-                str(Path("common_dir/common_inner_dir/inner_src_file.txt")),
+        "src": {
+            FileType.FILE: {
+                FileStatus.UNIQUE: {
+                    _p("nested_src_dir/nested_src_file.txt"),
+                    _p("src_dir_dst_file/.keep"),
+                    _p("common_dir/source_file.txt"),
+                    _p("common_dir/common_inner_dir/inner_src_file.txt"),
+                },
+                FileStatus.MISMATCHED: {_p("src_file_dst_dir")},
             },
-            FileStatus.MISMATCHED: {str(Path("src_file_dst_dir"))},
-        },
-        FileType.DIR: {
-            FileStatus.UNIQUE: {str(Path("nested_src_dir"))},
-            FileStatus.MISMATCHED: {str(Path("src_dir_dst_file"))},
-        },
-    },
-    "mutual": {
-        FileType.FILE: {
-            FileStatus.CHANGED | FileStatus.NEWER: {str(Path("newer.txt"))},
-            FileStatus.CHANGED | FileStatus.OLDER: {str(Path("older.txt"))},
-            FileStatus.EQUAL: {
-                str(Path("equal_file.txt")),
-                str(Path("common_dir/common_inner_dir/common_inner_file.txt")),
+            FileType.DIR: {
+                FileStatus.UNIQUE: {_p("nested_src_dir")},
+                FileStatus.MISMATCHED: {_p("src_dir_dst_file")},
             },
         },
-        FileType.DIR: {
-            FileStatus.NOT_COMPARED: {
-                str(Path("common_dir")),
-                str(Path("common_dir/common_inner_dir")),
+        "mutual": {
+            FileType.FILE: {
+                FileStatus.CHANGED | FileStatus.NEWER: {_p("newer.txt")},
+                FileStatus.CHANGED | FileStatus.OLDER: {_p("older.txt")},
+                FileStatus.EQUAL: {
+                    _p("equal_file.txt"),
+                    _p("common_dir/common_inner_dir/common_inner_file.txt"),
+                },
+            },
+            FileType.DIR: {
+                FileStatus.NOT_COMPARED: {
+                    _p("common_dir"),
+                    _p("common_dir/common_inner_dir"),
+                },
+            },
+            FileType.SYMLINK: {
+                FileStatus.NOT_COMPARED: {
+                    _p("common_dir/loop_link"),
+                }
             },
         },
-        FileType.SYMLINK: {
-            FileStatus.NOT_COMPARED: {
-                str(Path("common_dir/loop_link")),
-            }
-        },
-    },
-}
+    }
+)
@@ -1,5 +1,14 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
-from py_backup.syncers import SyncABC
+from pathlib import Path
+from unittest import mock
+from py_backup import syncers
+from py_backup.syncers import SyncABC, Rsync, IoUringSync
+from .global_test_vars import SOURCE, DESTINATION
 
 
 class TestUtils(unittest.TestCase):
@@ -16,3 +25,309 @@ class TestUtils(unittest.TestCase):
         args3 = ["rsync", "--option1", "rsync", "--option2", "dest", "--option1"]
         filtered3 = filter_args(args3, {"rsync", "dest"})
         self.assertEqual(filtered3, ["--option1", "--option2", "--option1"])
+
+
+class TestRsync(unittest.TestCase):
+    def test_subprocess_run_output_callback(self):
+        rsync = Rsync(SOURCE, DESTINATION)
+        args = [sys.executable, "-c", "print('line1'); print('line2')"]
+        lines = []
+
+        result = rsync.subprocess_run(args, {"capture_output": True}, lines.append)
+        self.assertEqual(lines, ["line1\n", "line2\n"])
+        self.assertEqual(result.stdout, "line1\nline2\n")
+        self.assertEqual(result.returncode, 0)
+
+        lines.clear()
+        result = rsync.subprocess_run(args, {}, lines.append)
+        self.assertEqual(len(lines), 2)
+        self.assertIsNone(result.stdout)
+
+        args = [
+            sys.executable,
+            "-c",
+            "import sys; print('out'); print('err', file=sys.stderr)",
+        ]
+        out, err = [], []
+        result = rsync.subprocess_run(
+            args, {"capture_output": True}, out.append, err.append
+        )
+        self.assertEqual((out, err), (["out\n"], ["err\n"]))
+        self.assertEqual((result.stdout, result.stderr), ("out\n", "err\n"))
+
+        # input and timeout are honoured with callbacks as well
+        args = [sys.executable, "-c", "import sys; print(sys.stdin.read() * 2)"]
+        lines.clear()
+        rsync.subprocess_run(args, {"input": "ab"}, lines.append)
+        self.assertEqual(lines, ["abab\n"])
+        rsync.subprocess_run(args, {"input": b"cd"}, lines.append)
+        self.assertEqual(lines[1:], ["cdcd\n"])
+
+        args = [sys.executable, "-c", "import time; time.sleep(5)"]
+        with self.assertRaises(subprocess.TimeoutExpired):
+            rsync.subprocess_run(args, {"timeout": 0.1}, lines.append)
+
+    def test_async_run(self):
+        args = [sys.executable, "-c", "import sys; print(sys.stdin.read() * 2)"]
+        kwargs = {"capture_output": True, "text": True, "input": "ab"}
+        result = asyncio.run(SyncABC._async_run(args, kwargs))
+        self.assertEqual((result.returncode, result.stdout), (0, "abab\n"))
+
+        args = [sys.executable, "-c", "import time; time.sleep(5)"]
+        with self.assertRaises(subprocess.TimeoutExpired):
+            asyncio.run(SyncABC._async_run(args, {"timeout": 0.1}))
+
+    def test_fast_defaults(self):
+        rsync = Rsync(SOURCE, DESTINATION, fast=True)
+        args = rsync.get_args(None, delete=False, dry_run=False)
+        self.assertEqual(args[1:-2], Rsync.fast_defaults())
+        # Explicit options always take precedence
+        args = rsync.get_args(["-a"], delete=False, dry_run=False)
+        self.assertEqual(args[1:-2], ["-a"])
+
+        rsync = Rsync(SOURCE, DESTINATION)
+        args = rsync.get_args(None, delete=False, dry_run=False)
+        self.assertEqual(args[1:-2], rsync.default_sync_options)
+
+    def test_sync_many(self):
+        with tempfile.TemporaryDirectory() as dst1:
+            with tempfile.TemporaryDirectory() as dst2:
+                pairs = [(SOURCE, dst1), (DESTINATION, dst1), (SOURCE, dst2)]
+
+                def fake_run(args, **_):
+                    returncode = 1 if args[-1] == f"{dst2}/" else 0
+                    return subprocess.CompletedProcess(args, returncode)
+
+                with mock.patch("subprocess.run", side_effect=fake_run) as run:
+                    results = Rsync.sync_many(pairs, options=["-a"])
+
+                called_args = sorted(call.args[0] for call in run.call_args_list)
+                self.assertEqual(
+                    called_args,
+                    [
+                        ["rsync", "-a", f"{SOURCE}/", f"{DESTINATION}/", f"{dst1}/"],
+                        ["rsync", "-a", f"{SOURCE}/", f"{dst2}/"],
+                    ],
+                )
+                # A failed call is recorded without affecting the other one
+                self.assertEqual([result.ok for result in results], [True, False])
+                self.assertIsInstance(results[1].error, subprocess.CalledProcessError)
+
+    def test_sync_filelist(self):
+        rsync = Rsync(SOURCE, DESTINATION)
+        completed = subprocess.CompletedProcess([], 0)
+        with mock.patch("subprocess.run", return_value=completed) as run:
+            rsync.sync_filelist(["a.txt", os.path.join("dir", "b.txt")], options=["-a"])
+
+        args, kwargs = run.call_args.args[0], run.call_args.kwargs
+        self.assertEqual(args[1:4], ["-a", "--files-from=-", "--from0"])
+        self.assertEqual(kwargs["input"], os.fsencode(f"a.txt\0dir{os.sep}b.txt"))
+
+    def test_lazy_dirs(self):
+        # Dirs are resolved and checked on first use, not on construction
+        rsync = Rsync("non_existing_dir", DESTINATION)
+        self.assertNotIn("src", rsync.__dict__)
+        with self.assertRaises(ValueError):
+            rsync.get_args(None, delete=False, dry_run=False)
+
+        # Relative dirs are resolved against the working directory at init
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.makedirs(os.path.join(tmp_dir, "a"))
+            os.makedirs(os.path.join(tmp_dir, "b"))
+            try:
+                os.chdir(tmp_dir)
+                rsync = Rsync("a", "b")
+                os.chdir(cwd)
+                self.assertEqual(
+                    os.path.realpath(rsync.src),
+                    os.path.realpath(os.path.join(tmp_dir, "a")),
+                )
+            finally:
+                os.chdir(cwd)
+        with self.assertRaises(ValueError):
+            Rsync("", DESTINATION)
+
+        # ".." after a symlink refers to the parent of the link target
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for path in ("a", os.path.join("x", "y"), os.path.join("x", "b")):
+                os.makedirs(os.path.join(tmp_dir, path))
+            os.symlink(
+                os.path.join(tmp_dir, "x", "y"), os.path.join(tmp_dir, "a", "link")
+            )
+            resolved = SyncABC.resolve_dir(
+                os.path.join(tmp_dir, "a", "link", "..", "b")
+            )
+            self.assertEqual(
+                resolved, Path(os.path.realpath(os.path.join(tmp_dir, "x", "b")))
+            )
+
+        # Removed dirs are caught, existence checks are not cached
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            SyncABC.resolve_dir(tmp_dir)
+        with self.assertRaises(ValueError):
+            SyncABC.resolve_dir(tmp_dir)
+
+    def test_reflink_sync(self):
+        with tempfile.TemporaryDirectory() as src:
+            with tempfile.TemporaryDirectory() as dst:
+                os.makedirs(os.path.join(src, "dir"))
+                with open(os.path.join(src, "dir", "file.txt"), "wb") as f:
+                    f.write(b"content")
+
+                rsync = Rsync(src, dst)
+                with mock.patch(
+                    "py_backup.syncers._supports_reflink", return_value=True
+                ):
+                    result = rsync.sync(prefer_reflink=True)
+
+                self.assertEqual(result.args[:3], ["cp", "--reflink=auto", "-a"])
+                self.assertEqual(result.returncode, 0)
+                with open(os.path.join(dst, "dir", "file.txt"), "rb") as f:
+                    self.assertEqual(f.read(), b"content")
+
+                # cp would overwrite every file, dsts with content are left to rsync
+                completed = subprocess.CompletedProcess([], 0)
+                with mock.patch(
+                    "py_backup.syncers._supports_reflink", return_value=True
+                ), mock.patch("subprocess.run", return_value=completed) as run:
+                    rsync.sync(prefer_reflink=True)
+                    # The fast defaults exclude files, which cp can not do
+                    with tempfile.TemporaryDirectory(dir=dst) as empty_dst:
+                        Rsync(src, empty_dst, fast=True).sync(prefer_reflink=True)
+                self.assertEqual(
+                    [call.args[0][0] for call in run.call_args_list], ["rsync", "rsync"]
+                )
+
+    @unittest.skipUnless(syncers._uring_available(), "io_uring not available")
+    def test_io_uring_sync(self):
+        with tempfile.TemporaryDirectory() as src:
+            with tempfile.TemporaryDirectory() as dst:
+                os.makedirs(os.path.join(src, "dir"))
+                os.makedirs(os.path.join(dst, "old_dir"))
+                files = {
+                    "empty.txt": b"",
+                    "changed.txt": b"changed content",
+                    os.path.join("dir", "large.bin"): os.urandom(100),
+                }
+                for entry, content in files.items():
+                    with open(os.path.join(src, entry), "wb") as f:
+                        f.write(content)
+                with open(os.path.join(dst, "changed.txt"), "wb") as f:
+                    f.write(b"old")
+
+                syncer = IoUringSync(src, dst)
+                # Several batches and files spanning batches
+                syncer.queue_depth, syncer.chunk_size = 2, 16
+                result = syncer.sync(delete=True)
+
+                self.assertEqual(result.returncode, 0)
+                for entry, content in files.items():
+                    with open(os.path.join(dst, entry), "rb") as f:
+                        self.assertEqual(f.read(), content)
+                self.assertFalse(os.path.exists(os.path.join(dst, "old_dir")))
+
+                # Short reads are completed instead of leaving holes
+                os.remove(os.path.join(dst, "dir", "large.bin"))
+                submit = IoUringSync._uring_submit
+
+                def short_read_submit(ring, ops):
+                    sizes = submit(ring, ops)
+                    if ops[0][0] is syncers.liburing.io_uring_prep_read:
+                        return [min(size, 3) for size in sizes]
+                    return sizes
+
+                with mock.patch.object(
+                    IoUringSync, "_uring_submit", side_effect=short_read_submit
+                ):
+                    syncer.sync()
+                with open(os.path.join(dst, "dir", "large.bin"), "rb") as f:
+                    self.assertEqual(f.read(), files[os.path.join("dir", "large.bin")])
+
+                # Same interface as Rsync.inproc_max_bytes
+                self.assertEqual(syncer.inproc_max_bytes, 64 << 20)
+                syncer.inproc_max_bytes = 1
+                self.assertEqual(syncer.inproc_max_bytes, 1)
+                with open(os.path.join(src, "changed.txt"), "ab") as f:
+                    f.write(b" again")
+                self.assertIsNone(syncer._inproc_sync(delete=True))
+
+    def test_get_args_paths(self):
+        rsync = Rsync(SOURCE, DESTINATION)
+        args = rsync.get_args(["-a", f"{SOURCE}/"], delete=True, dry_run=False)
+        self.assertEqual(
+            args, ["rsync", "-a", "--delete", f"{SOURCE}/", f"{DESTINATION}/"]
+        )
+        # Several sources are synced with one call, backup options go before them
+        rsync = Rsync([SOURCE, DESTINATION], DESTINATION)
+        args = rsync.get_args(["-a"], delete=False, dry_run=False)
+        self.assertEqual(
+            args, ["rsync", "-a", f"{SOURCE}/", f"{DESTINATION}/", f"{DESTINATION}/"]
+        )
+        backup_args = rsync.backup("backup", None, args)
+        self.assertEqual(backup_args[2:4], ["--backup", "--backup-dir=backup"])
+        self.assertNotIn("--backup", args)
+        # Unwanted args given as frozenset must work in dedupe mode as well
+        filtered = SyncABC.filter_args(
+            ["-a", "-a", "rsync"], frozenset({"rsync"}), False
+        )
+        self.assertEqual(filtered, ["-a"])
+
+    def test_inproc_sync(self):
+        with tempfile.TemporaryDirectory() as src:
+            with tempfile.TemporaryDirectory() as dst:
+                os.makedirs(os.path.join(src, "new_dir", "nested"))
+                os.makedirs(os.path.join(dst, "old_dir"))
+                files = {
+                    os.path.join(src, "new_dir", "nested", "new.txt"): b"new",
+                    os.path.join(src, "changed.txt"): b"changed content",
+                    os.path.join(dst, "changed.txt"): b"old content",
+                    os.path.join(src, "same_size.txt"): b"new",
+                    os.path.join(dst, "same_size.txt"): b"old",
+                    os.path.join(dst, "old_dir", "old.txt"): b"old",
+                }
+                for path, content in files.items():
+                    with open(path, "wb") as f:
+                        f.write(content)
+                os.utime(os.path.join(dst, "changed.txt"), (1_000_000, 1_000_000))
+                # Within DirComparator's mtime tolerance, still changed for rsync
+                os.utime(os.path.join(src, "same_size.txt"), (1_000_001, 1_000_001))
+                os.utime(os.path.join(dst, "same_size.txt"), (1_000_000, 1_000_000))
+                os.utime(os.path.join(src, "new_dir"), (1_000_000, 1_000_000))
+
+                rsync = Rsync(src, dst)
+                rsync.inproc_max_bytes = 1024
+                # Subprocess kwargs can not be honoured in process
+                completed = subprocess.CompletedProcess([], 0)
+                with mock.patch("subprocess.run", return_value=completed) as run:
+                    rsync.sync(delete=True, subprocess_kwargs={"capture_output": True})
+                run.assert_called_once()
+
+                result = rsync.sync(delete=True)
+
+                self.assertEqual(result.returncode, 0)
+                for entry, content in (
+                    ("changed.txt", b"changed content"),
+                    ("same_size.txt", b"new"),
+                ):
+                    with open(os.path.join(dst, entry), "rb") as f:
+                        self.assertEqual(f.read(), content)
+                self.assertTrue(
+                    os.path.isfile(os.path.join(dst, "new_dir", "nested", "new.txt"))
+                )
+                self.assertEqual(
+                    os.stat(os.path.join(dst, "new_dir")).st_mtime, 1_000_000
+                )
+                self.assertFalse(os.path.exists(os.path.join(dst, "old_dir")))
+
+                # Fast mode excludes files, so rsync is used
+                fast_rsync = Rsync(src, dst, fast=True)
+                fast_rsync.inproc_max_bytes = 1024
+                with mock.patch("subprocess.run", return_value=completed) as run:
+                    fast_rsync.sync(delete=True)
+                run.assert_called_once()
+
+                # Too large transfers are not handled in process
+                rsync.inproc_max_bytes = 1
+                os.utime(os.path.join(dst, "changed.txt"), (1_000_000, 1_000_000))
+                self.assertIsNone(rsync._inproc_sync(delete=True))
@@ -0,0 +1,131 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from py_backup import utils
+from py_backup.syncers import Rsync, Robocopy
+from .global_test_vars import SOURCE, DESTINATION, TEST_DATA_DIR
+
+
+class TestFolderBackup(unittest.TestCase):
+    def setUp(self):
+        completed = subprocess.CompletedProcess([], 0)
+        patcher = mock.patch("subprocess.run", return_value=completed)
+        self.run = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_several_sources(self):
+        with mock.patch.object(utils, "_SYNCER_CLASS", Rsync):
+            utils.folder_backup([SOURCE, DESTINATION], TEST_DATA_DIR, delete=True)
+        # One rsync call for all sources
+        self.run.assert_called_once()
+        args = self.run.call_args.args[0]
+        self.assertEqual(
+            args[-3:], [f"{SOURCE}/", f"{DESTINATION}/", f"{TEST_DATA_DIR}/"]
+        )
+
+        robocopy = mock.patch.multiple(
+            utils, _SYNCER_CLASS=Robocopy, _SYNC_OPTIONS={"defaults": ["/E"]}
+        )
+        with robocopy:
+            # Each robocopy call would purge what the previous one copied
+            with self.assertRaises(ValueError):
+                utils.folder_backup([SOURCE, DESTINATION], TEST_DATA_DIR, delete=True)
+            self.run.reset_mock()
+            utils.folder_backup([SOURCE, DESTINATION], TEST_DATA_DIR)
+        self.assertEqual(
+            [call.args[0][1] for call in self.run.call_args_list],
+            [str(SOURCE), str(DESTINATION)],
+        )
+
+    def test_invalid_sources(self):
+        for sources in ([], [SOURCE, SOURCE], [SOURCE, f"{SOURCE}/"]):
+            with self.assertRaises(ValueError):
+                utils.folder_backup(sources, DESTINATION)
+        self.run.assert_not_called()
+
+    def test_folder_backup_many(self):
+        def fake_run(args, **_):
+            returncode = 1 if args[-1] == f"{DESTINATION}/" else 0
+            return subprocess.CompletedProcess(args, returncode)
+
+        self.run.side_effect = fake_run
+        jobs = [
+            {"source": SOURCE, "destination": DESTINATION},
+            {"source": DESTINATION, "destination": SOURCE},
+        ]
+        with mock.patch.object(utils, "_SYNCER_CLASS", Rsync):
+            results = utils.folder_backup_many(jobs, max_workers=2)
+
+        # A failed job does not affect the other, results keep the job order
+        self.assertEqual([result.returncode for result in results], [1, 0])
+        self.assertEqual(
+            [result.args[-1] for result in results],
+            [f"{DESTINATION}/", f"{SOURCE}/"],
+        )
+
+
+class TestIncremental(unittest.TestCase):
+    def setUp(self):
+        self.source = tempfile.mkdtemp()
+        self.destination = tempfile.mkdtemp()
+        self.backup_dir = tempfile.mkdtemp()
+        for path in (self.source, self.destination, self.backup_dir):
+            self.addCleanup(shutil.rmtree, path)
+        with open(os.path.join(self.source, "file.txt"), "w") as f:
+            f.write("content")
+
+    def incremental(self, returncode=0, dry_run=False, num_incremental=5):
+        completed = subprocess.CompletedProcess([], returncode)
+        with mock.patch.object(utils, "folder_backup", return_value=completed) as fb:
+            utils.incremental(
+                self.source,
+                self.destination,
+                dry_run,
+                self.backup_dir,
+                num_incremental,
+                skip_unchanged=True,
+            )
+        return fb.called
+
+    def test_skip_unchanged(self):
+        # Failed and dry runs do not store the fingerprint
+        self.assertTrue(self.incremental(returncode=1))
+        self.assertTrue(self.incremental(dry_run=True))
+        self.assertTrue(self.incremental())
+        # Unchanged source is skipped
+        self.assertFalse(self.incremental())
+
+        with open(os.path.join(self.source, "file.txt"), "a") as f:
+            f.write(" changed")
+        self.assertTrue(self.incremental())
+
+        # Old backups are pruned even if the sync is skipped
+        names = [f"{utils._INCR_BACKUP_PREFIX}23010{i}_120000" for i in range(1, 4)]
+        for name in names:
+            os.makedirs(os.path.join(self.backup_dir, name))
+        self.assertFalse(self.incremental(num_incremental=2))
+        self.assertEqual(
+            sorted(
+                entry
+                for entry in os.listdir(self.backup_dir)
+                if entry.startswith(utils._INCR_BACKUP_PREFIX)
+            ),
+            names[1:],
+        )
+
+    def test_remove_trees(self):
+        paths = [Path(self.backup_dir) / f"tree{i}" for i in range(3)]
+        for path in paths:
+            (path / "sub").mkdir(parents=True)
+            (path / "sub" / "file.txt").write_text("content")
+
+        utils._remove_trees(paths[:1])
+        self.assertFalse(paths[0].exists())
+        utils._remove_trees(paths[1:])
+        self.assertEqual(os.listdir(self.backup_dir), [])
+        with self.assertRaises(OSError):
+            utils._remove_trees(paths[1:])